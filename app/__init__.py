@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.01
+# Updated:    2026.10.18
 #
 # This script initializes the Flask application.
 #
@@ -17,21 +17,39 @@
 
 from flask import Flask, g
 from flask_cors import CORS
+from app.config import load_settings
 from app.routes import register_routes
+from app.dispatch import Dispatcher, COMMAND
+from app.errors import ErrorLog
+from app.fleet import Fleet, parse_fleet
 from hackerbot import Hackerbot
 
 def create_app():
     app = Flask(__name__)
 
     # Load configuration
-    app.config.from_object('app.config.Config')
-
-    # Create a single controller instance
-    robot = Hackerbot()
-    robot.base.initialize()
-    
-    # Store everything in app.config
-    app.config['ROBOT'] = robot
+    app.config.update(load_settings())
+
+    # Create one controller instance per robot, a single robot unless a fleet is configured
+    error_log = ErrorLog(app.config['ERROR_LOG_SIZE'])
+    robots = parse_fleet(app.config['HACKERBOT_FLEET']) or {app.config['ROBOT_ID']: None}
+    fleet = Fleet()
+    for robot_id, port in robots.items():
+        fleet.add(robot_id, Dispatcher(Hackerbot(port=port), error_log, app.config['DISPATCH_TIMEOUT'], robot_id,
+                                       app.config['QUERY_WORKERS']))
+    # Bounded so a hung robot can't stop the API from starting, it is reported instead
+    outcomes = fleet.gather('base', 'initialize', lambda robot: robot.base.initialize,
+                            app.config['DISPATCH_TIMEOUT'], lane=COMMAND)
+    for robot_id, outcome in outcomes.items():
+        if outcome.error is not None:
+            app.logger.error(f"Failed to initialize robot {robot_id}: {outcome.error.message}")
+
+    # Store everything in app.config, unprefixed routes talk to the first robot
+    dispatcher = fleet.get(next(iter(robots)))
+    app.config['ROBOT'] = dispatcher.robot
+    app.config['DISPATCHER'] = dispatcher
+    app.config['ERROR_LOG'] = error_log
+    app.config['FLEET'] = fleet
 
     # Enable CORS (Allows frontend to communicate with backend)
     CORS(app)
@@ -6,19 +6,152 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.01
+# Updated:    2026.10.18
 #
-# This script contains the configuration for the Flask application.
+# This script contains the typed runtime settings of the Flask application.
 #
 # Special thanks to the following for their code contributions to this codebase:
 # Allen Chien - https://github.com/AllenChienXXX
 ################################################################################
 
 
+import json
+import math
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-load_dotenv()
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+FALSE_VALUES = ('0', 'false', 'no', 'off')
 
-class Config:
-    SECRET_KEY = os.getenv('SECRET_KEY', 'supersecretkey')
\ No newline at end of file
+class ConfigError(ValueError):
+    def __init__(self, errors):
+        super().__init__('; '.join(f"{name}: {message}" for name, message in errors.items()))
+        self.errors = errors
+
+class Setting:
+    """
+    A typed setting with its default and validation.
+
+    Reloadable settings are read on every use, or applied to the objects that
+    hold them on reload, so they can change without restarting the robot link.
+    """
+
+    def __init__(self, name, type, default, description, reloadable=False, minimum=None, secret=False):
+        self.name = name
+        self.type = type
+        self.default = default
+        self.description = description
+        self.reloadable = reloadable
+        self.minimum = minimum
+        self.secret = secret
+
+    def parse(self, raw):
+        if self.type is bool:
+            if isinstance(raw, bool):
+                return raw
+            value = str(raw).strip().lower()
+            if value in TRUE_VALUES:
+                return True
+            if value in FALSE_VALUES:
+                return False
+            raise ValueError(f"expected a boolean, got {raw!r}")
+        if self.type in (int, float):
+            value = self.parse_number(raw)
+        else:
+            value = self.type(raw)
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"must be at least {self.minimum}")
+        return value
+
+    def parse_number(self, raw):
+        # bool is an int subclass, and int() would truncate 2.9 to 2
+        try:
+            if isinstance(raw, bool):
+                raise TypeError
+            value = float(raw)
+        except (TypeError, ValueError):
+            raise ValueError(f"expected {self.type.__name__}, got {raw!r}")
+        if not math.isfinite(value):
+            raise ValueError(f"must be a finite number, got {raw!r}")
+        if self.type is int:
+            if not value.is_integer():
+                raise ValueError(f"expected int, got {raw!r}")
+            return int(value)
+        return value
+
+    def to_dict(self, value):
+        return {
+            'value': '********' if self.secret else value,
+            'default': '********' if self.secret else self.default,
+            'type': self.type.__name__,
+            'reloadable': self.reloadable,
+            'description': self.description,
+        }
+
+SETTINGS = {setting.name: setting for setting in [
+    Setting('SECRET_KEY', str, 'supersecretkey', "Flask secret key", secret=True),
+    Setting('HACKERBOT_FLEET', str, '', "Robots served by this process, e.g. \"alpha=/dev/ttyACM0,beta=/dev/ttyACM1\". "
+            "Left empty, a single robot is connected on the default port"),
+    Setting('ROBOT_ID', str, 'hackerbot', "Id of the robot when no fleet is configured"),
+    Setting('DISPATCH_TIMEOUT', float, 30.0, "Seconds to wait for a robot command before answering with a timeout error",
+            reloadable=True, minimum=0.1),
+    Setting('QUERY_WORKERS', int, 4, "Workers per robot answering read-only queries such as position and status",
+            minimum=1),
+    Setting('FLEET_TIMEOUT', float, 2.0, "Seconds fleet-wide queries wait for each robot before reporting it as timed out",
+            reloadable=True, minimum=0.1),
+    Setting('ERROR_LOG_SIZE', int, 256, "Number of recent command errors kept for /api/error", reloadable=True, minimum=1),
+    Setting('MAP_CHUNK_SIZE', int, 64 * 1024, "Size of the chunks map downloads are streamed in", reloadable=True, minimum=1),
+    Setting('MAP_VERSIONS', int, 4, "Versions kept per map for diffing", reloadable=True, minimum=1),
+    Setting('MAP_CACHE_SIZE', int, 64 * 1024 * 1024, "Total size of the cached map versions, in characters", reloadable=True, minimum=1),
+    Setting('MAP_TILE_SIZE', int, 1024, "Size of the tiles map diffs are made of", reloadable=True, minimum=1),
+    Setting('PROFILING', bool, False, "Per-request span timing and the Server-Timing header", reloadable=True),
+    Setting('SLOW_REQUEST_MS', float, 1000.0, "Requests slower than this are kept in /api/debug/slow",
+            reloadable=True, minimum=0),
+    Setting('SLOW_REQUEST_LOG_SIZE', int, 50, "Number of slow requests kept", reloadable=True, minimum=1),
+]}
+
+def read_sources(environ=None):
+    """
+    Merge the raw settings from, lowest priority first, the JSON file named by
+    HACKERBOT_CONFIG, the .env file and the environment.
+    """
+    environ = os.environ if environ is None else environ
+    raw = {}
+    config_file = environ.get('HACKERBOT_CONFIG') or dotenv_values().get('HACKERBOT_CONFIG')
+    if config_file:
+        try:
+            with open(config_file) as f:
+                raw.update(json.load(f))
+        except (OSError, ValueError) as e:
+            raise ConfigError({'HACKERBOT_CONFIG': f"cannot read {config_file}: {e}"})
+    raw.update(dotenv_values())
+    raw.update(environ)
+    return raw
+
+def validate(raw, names=None, allow_null=True):
+    """
+    Parse the given raw values, raising a ConfigError listing every invalid one.
+
+    Missing or null values fall back to the default, unless allow_null is False.
+    """
+    values = {}
+    errors = {}
+    for name in (SETTINGS if names is None else names):
+        setting = SETTINGS.get(name)
+        if setting is None:
+            errors[name] = "unknown setting"
+        elif raw.get(name) is None and not allow_null:
+            errors[name] = "must not be null"
+        elif raw.get(name) is None:
+            values[name] = setting.default
+        else:
+            try:
+                values[name] = setting.parse(raw[name])
+            except ValueError as e:
+                errors[name] = str(e)
+    if errors:
+        raise ConfigError(errors)
+    return values
+
+def load_settings(environ=None):
+    return validate(read_sources(environ))
@@ -0,0 +1,165 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script runs robot calls on per-robot dispatch workers and attaches the
+# error of each failed call to its own response.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from flask import abort, current_app, g, jsonify, make_response
+from app.errors import (CommandError, ErrorLog, COMMAND_FAILED, COMMAND_TIMEOUT,
+                        COMMAND_EXCEPTION)
+from app.profiling import record_span, span
+
+class CommandOutcome:
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        # perf_counter() times the command was queued, started and finished on the worker
+        self.timings = None
+
+    def record_spans(self):
+        if self.timings is not None:
+            queued_at, started_at, finished_at = self.timings
+            record_span('queue', queued_at, started_at)
+            record_span('hardware', started_at, finished_at)
+
+    def to_response(self):
+        with span('serialize'):
+            if self.error is not None:
+                return jsonify({'error': self.error.to_dict()}), self.error.http_status
+            return jsonify({'response': self.result})
+
+# Dispatch lanes, see Dispatcher
+COMMAND = 'command'
+QUERY = 'query'
+URGENT = 'urgent'
+
+class Dispatcher:
+    """
+    Runs the hardware calls of one robot on three lanes of workers.
+
+    Commands run one at a time and in order on the command lane. Motion
+    commands block until the robot stops, so commands are never timed out.
+    Read-only queries such as position and status run on a small pool of their
+    own so they answer while the robot moves, and urgent commands such as kill
+    get a worker of their own so they never wait behind a motion command.
+    Queries and urgent commands are timed out after DISPATCH_TIMEOUT.
+
+    The Hackerbot library only keeps the last error of the controller, so a
+    failed call only reports that error if it changed during the call. Calls
+    running on other lanes at the same moment can still change it, in which
+    case the error may belong to one of them.
+    """
+
+    def __init__(self, robot, error_log=None, timeout=None, robot_id=None, query_workers=4):
+        self.robot = robot
+        self.robot_id = robot_id
+        self.error_log = error_log if error_log is not None else ErrorLog()
+        self.timeout = timeout
+        self._executors = {
+            COMMAND: ThreadPoolExecutor(max_workers=1, thread_name_prefix='hackerbot-command'),
+            QUERY: ThreadPoolExecutor(max_workers=query_workers, thread_name_prefix='hackerbot-query'),
+            URGENT: ThreadPoolExecutor(max_workers=1, thread_name_prefix='hackerbot-urgent'),
+        }
+
+    def submit(self, subsystem, method, fn, *args, lane=COMMAND, ok=bool,
+               failure_code=COMMAND_FAILED, failure_message=None):
+        """
+        Queue fn on a lane without waiting for it.
+
+        ok(result) tells whether the call succeeded, failed calls are reported
+        with failure_code and, if the robot logged no new error, failure_message.
+        """
+        queued_at = time.perf_counter()
+        failure = (failure_code, failure_message or f"{subsystem} {method} failed")
+        future = self._executors[lane].submit(self._run, queued_at, subsystem, method, ok, failure, fn, *args)
+        future.queued_at = queued_at
+        future.lane = lane
+        return future
+
+    def wait(self, future, subsystem, method, timeout=None):
+        """
+        Wait for a submitted call and record its error if it failed.
+
+        Without an explicit timeout, queries and urgent commands wait up to
+        DISPATCH_TIMEOUT and commands wait until they finish.
+        """
+        if timeout is None and future.lane != COMMAND:
+            timeout = self.timeout
+        try:
+            outcome = future.result(timeout)
+        except TimeoutError:
+            latency_ms = (time.perf_counter() - future.queued_at) * 1000
+            # A call that has not started yet is dropped rather than run later
+            if future.cancel():
+                message = f"No response after {latency_ms / 1000:.1f}s, command dropped"
+            else:
+                message = f"No response after {latency_ms / 1000:.1f}s, command still running"
+            outcome = CommandOutcome(error=CommandError(COMMAND_TIMEOUT, subsystem, method, message, latency_ms))
+        outcome.record_spans()
+        if outcome.error is not None:
+            outcome.error.robot_id = self.robot_id
+            self.error_log.record(outcome.error)
+        return outcome
+
+    def dispatch(self, subsystem, method, fn, *args, **options):
+        """Run fn on a lane and capture its error if ok(result) is false, see submit()."""
+        with span('dispatch'):
+            future = self.submit(subsystem, method, fn, *args, **options)
+            return self.wait(future, subsystem, method)
+
+    def _run(self, queued_at, subsystem, method, ok, failure, fn, *args):
+        started_at = time.perf_counter()
+        previous_error = self.robot.get_error()
+        try:
+            result = fn(*args)
+        except Exception as e:
+            latency_ms = (time.perf_counter() - started_at) * 1000
+            outcome = CommandOutcome(error=CommandError(COMMAND_EXCEPTION, subsystem, method, str(e), latency_ms))
+        else:
+            latency_ms = (time.perf_counter() - started_at) * 1000
+            if ok(result):
+                outcome = CommandOutcome(result=result)
+            else:
+                # An unchanged error was left by an earlier call, maybe another client's
+                error = self.robot.get_error()
+                code, message = failure
+                if error and error != previous_error:
+                    message = str(error)
+                outcome = CommandOutcome(error=CommandError(code, subsystem, method, message, latency_ms))
+        outcome.timings = (queued_at, started_at, started_at + latency_ms / 1000)
+        return outcome
+
+    def shutdown(self):
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def get_error_log():
+    return current_app.config.setdefault('ERROR_LOG', ErrorLog(current_app.config.get('ERROR_LOG_SIZE', 256)))
+
+def get_dispatcher():
+    """
+    Return the dispatcher of the robot addressed by the request.
+
+    Fleet routes carry a robot_id, every other route uses the configured robot.
+    """
+    robot_id = g.get('robot_id')
+    if robot_id is not None:
+        dispatcher = current_app.config['FLEET'].get(robot_id)
+        if dispatcher is None:
+            abort(make_response(jsonify({'error': f"Robot not found: {robot_id}"}), 404))
+        return dispatcher
+    return current_app.config['DISPATCHER']
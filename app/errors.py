@@ -0,0 +1,94 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script contains the structured error model and the in-memory error log.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import itertools
+import threading
+import time
+from collections import deque
+
+# Error codes and the HTTP status each one is reported with
+COMMAND_FAILED = 'command_failed'
+COMMAND_TIMEOUT = 'command_timeout'
+COMMAND_EXCEPTION = 'command_exception'
+NOT_FOUND = 'not_found'
+
+HTTP_STATUS = {
+    NOT_FOUND: 404,
+    COMMAND_FAILED: 502,
+    COMMAND_TIMEOUT: 504,
+    COMMAND_EXCEPTION: 500,
+}
+
+class CommandError:
+    def __init__(self, code, subsystem, method, message, latency_ms):
+        self.id = None
+        self.robot_id = None
+        self.code = code
+        self.subsystem = subsystem
+        self.method = method
+        self.message = message
+        self.latency_ms = latency_ms
+        self.timestamp = time.time()
+
+    @property
+    def http_status(self):
+        return HTTP_STATUS.get(self.code, 500)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'robot_id': self.robot_id,
+            'code': self.code,
+            'subsystem': self.subsystem,
+            'method': self.method,
+            'message': self.message,
+            'latency_ms': self.latency_ms,
+            'timestamp': self.timestamp,
+        }
+
+class ErrorLog:
+    """Bounded ring of the most recent command errors, safe to share between threads."""
+
+    def __init__(self, maxlen=256):
+        self._errors = deque(maxlen=maxlen)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def resize(self, maxlen):
+        with self._lock:
+            self._errors = deque(self._errors, maxlen=maxlen)
+
+    def record(self, error):
+        with self._lock:
+            error.id = next(self._ids)
+            self._errors.append(error)
+        return error
+
+    def latest(self):
+        with self._lock:
+            return self._errors[-1] if self._errors else None
+
+    def query(self, since=None, subsystem=None, robot_id=None):
+        with self._lock:
+            errors = list(self._errors)
+        if since is not None:
+            errors = [e for e in errors if e.id > since]
+        if subsystem is not None:
+            errors = [e for e in errors if e.subsystem == subsystem]
+        if robot_id is not None:
+            errors = [e for e in errors if e.robot_id == robot_id]
+        return errors
@@ -0,0 +1,82 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script contains the registry of robots served by one API process.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import threading
+import time
+from app.dispatch import QUERY
+
+def parse_fleet(spec):
+    """
+    Parse a fleet spec of the form "alpha=/dev/ttyACM0,beta=/dev/ttyACM1".
+
+    A robot without "=port" is connected on the default port.
+    """
+    robots = {}
+    for entry in spec.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        robot_id, _, port = entry.partition('=')
+        robots[robot_id.strip()] = port.strip() or None
+    return robots
+
+class Fleet:
+    """Registry of robot dispatchers, each with its own dispatch worker."""
+
+    def __init__(self):
+        self._dispatchers = {}
+        self._lock = threading.Lock()
+
+    def add(self, robot_id, dispatcher):
+        with self._lock:
+            self._dispatchers[robot_id] = dispatcher
+
+    def get(self, robot_id):
+        with self._lock:
+            return self._dispatchers.get(robot_id)
+
+    def ids(self):
+        with self._lock:
+            return list(self._dispatchers)
+
+    def dispatchers(self):
+        with self._lock:
+            return list(self._dispatchers.values())
+
+    def gather(self, subsystem, method, select, timeout=None, lane=QUERY):
+        """
+        Run select(robot) on every robot in parallel and return the outcomes by robot_id.
+
+        Queries run on the query lane of each robot, so they answer while the
+        robot is moving.
+
+        All commands are queued before any is waited on, so the whole call
+        takes as long as the slowest robot rather than the sum of them.
+        """
+        with self._lock:
+            dispatchers = dict(self._dispatchers)
+        futures = {
+            robot_id: dispatcher.submit(subsystem, method, select(dispatcher.robot), lane=lane)
+            for robot_id, dispatcher in dispatchers.items()
+        }
+
+        outcomes = {}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for robot_id, future in futures.items():
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            outcomes[robot_id] = dispatchers[robot_id].wait(future, subsystem, method, remaining)
+        return outcomes
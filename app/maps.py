@@ -0,0 +1,137 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script contains the versioned map store and the map diffing.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import itertools
+import threading
+from collections import OrderedDict
+import numpy as np
+
+def as_array(map_data):
+    """View map data as an array with one element per character or byte."""
+    if isinstance(map_data, str):
+        if map_data.isascii():
+            return np.frombuffer(map_data.encode('ascii'), dtype=np.uint8)
+        return np.frombuffer(map_data.encode('utf-32-le'), dtype=np.uint32)
+    return np.frombuffer(map_data, dtype=np.uint8)
+
+def diff_tiles(old, new, tile_size):
+    """
+    Return the indices of the tiles of new that differ from old.
+
+    A tile is tile_size consecutive characters (or bytes) of the map data, so
+    new can be rebuilt from old[:len(new)] by overwriting the changed tiles.
+    """
+    a, b = as_array(old), as_array(new)
+    if a.dtype != b.dtype:
+        a, b = a.astype(np.uint32), b.astype(np.uint32)
+
+    old_length, new_length = len(a), len(b)
+    tiles = -(-new_length // tile_size)
+    padded = tiles * tile_size
+    a = np.pad(a[:new_length], (0, padded - min(old_length, new_length)))
+    b = np.pad(b, (0, padded - new_length))
+
+    changed = (a != b).reshape(tiles, tile_size).any(axis=1)
+    # Tiles whose range in new reaches past the end of old have nothing to be rebuilt from
+    changed |= np.minimum((np.arange(tiles) + 1) * tile_size, new_length) > old_length
+    return np.flatnonzero(changed)
+
+class MapStore:
+    """
+    Keeps the last few versions of every fetched map, safe to share between threads.
+
+    Maps are keyed by (robot_id, map_id) since every robot of a fleet has its own maps.
+    The total size of the kept versions is bounded by evicting the least recently
+    used maps first.
+    """
+
+    def __init__(self):
+        self._maps = OrderedDict()
+        self._stale = set()
+        self._size = 0
+        self._versions = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._maps and key not in self._stale
+
+    def __len__(self):
+        with self._lock:
+            return len(self._maps)
+
+    @property
+    def size(self):
+        """Total characters (or bytes) of all kept versions."""
+        with self._lock:
+            return self._size
+
+    def put(self, key, map_data, max_versions=4, max_size=None):
+        """Store map_data as the latest version of the map and return its version."""
+        with self._lock:
+            self._stale.discard(key)
+            versions = self._maps.setdefault(key, OrderedDict())
+            self._maps.move_to_end(key)
+            if versions:
+                version, latest = next(reversed(versions.items()))
+                if latest == map_data:
+                    return version
+            version = next(self._versions)
+            versions[version] = map_data
+            self._size += len(map_data)
+            self._trim(max_versions, max_size)
+            return version
+
+    def latest(self, key):
+        """Return (version, map_data) of the latest version, or (None, None)."""
+        with self._lock:
+            versions = self._maps.get(key)
+            if not versions:
+                return None, None
+            self._maps.move_to_end(key)
+            return next(reversed(versions.items()))
+
+    def get(self, key, version):
+        with self._lock:
+            return self._maps.get(key, {}).get(version)
+
+    def invalidate(self, robot_id):
+        """Mark every map of a robot for refetching, keeping its versions to diff against."""
+        with self._lock:
+            self._stale.update(key for key in self._maps if key[0] == robot_id)
+
+    def trim(self, max_versions, max_size=None):
+        """Apply new limits to the maps already kept."""
+        with self._lock:
+            self._trim(max_versions, max_size)
+
+    def _trim(self, max_versions, max_size):
+        for versions in self._maps.values():
+            while len(versions) > max_versions:
+                self._size -= len(versions.popitem(last=False)[1])
+        if max_size is None:
+            return
+        # Evict whole maps, least recently used first, but always keep the latest
+        # version of the most recently used one so a fetched map can be served
+        while self._size > max_size and len(self._maps) > 1:
+            key, versions = self._maps.popitem(last=False)
+            self._stale.discard(key)
+            self._size -= sum(len(map_data) for map_data in versions.values())
+        if self._maps:
+            versions = next(reversed(self._maps.values()))
+            while self._size > max_size and len(versions) > 1:
+                self._size -= len(versions.popitem(last=False)[1])
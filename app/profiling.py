@@ -0,0 +1,190 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script contains the request span timing, the slow request log and the
+# sampling profiler.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from flask import current_app, g, has_request_context
+
+# -------------------- SPANS --------------------
+def new_span(name, start, end=None):
+    return {'name': name, 'start': start, 'end': end, 'children': []}
+
+def begin_request_spans(name):
+    """Start the span tree of the current request."""
+    root = new_span(name, time.perf_counter())
+    g.span_stack = [root]
+    return root
+
+def current_span():
+    if not has_request_context():
+        return None
+    stack = g.get('span_stack')
+    return stack[-1] if stack else None
+
+@contextmanager
+def span(name):
+    """Time the enclosed block as a child of the current span, if the request is being timed."""
+    parent = current_span()
+    if parent is None:
+        yield
+        return
+    child = new_span(name, time.perf_counter())
+    parent['children'].append(child)
+    g.span_stack.append(child)
+    try:
+        yield
+    finally:
+        child['end'] = time.perf_counter()
+        g.span_stack.pop()
+
+def record_span(name, start, end):
+    """Add a span measured elsewhere, e.g. on a dispatch worker, to the current span."""
+    parent = current_span()
+    if parent is not None:
+        parent['children'].append(new_span(name, start, end))
+
+def span_duration_ms(s):
+    return (s['end'] - s['start']) * 1000
+
+def iter_spans(s):
+    for child in s['children']:
+        yield child
+        yield from iter_spans(child)
+
+def server_timing(root):
+    """Format a finished span tree as a Server-Timing header value."""
+    entries = [f"{s['name']};dur={span_duration_ms(s):.2f}" for s in iter_spans(root) if s['end'] is not None]
+    entries.append(f"total;dur={span_duration_ms(root):.2f}")
+    return ', '.join(entries)
+
+def span_tree(s, origin=None):
+    """Convert a finished span tree to a dict with times in milliseconds from its start."""
+    origin = s['start'] if origin is None else origin
+    return {
+        'name': s['name'],
+        'start_ms': (s['start'] - origin) * 1000,
+        'duration_ms': span_duration_ms(s) if s['end'] is not None else None,
+        'children': [span_tree(child, origin) for child in s['children']],
+    }
+
+class SlowRequestLog:
+    """Bounded store of the span trees of the slowest recent requests."""
+
+    def __init__(self, maxlen=50):
+        self._requests = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def resize(self, maxlen):
+        with self._lock:
+            self._requests = deque(self._requests, maxlen=maxlen)
+
+    def record(self, entry):
+        with self._lock:
+            self._requests.append(entry)
+
+    def list(self):
+        with self._lock:
+            return list(self._requests)
+
+    def clear(self):
+        with self._lock:
+            self._requests.clear()
+
+# -------------------- SAMPLING PROFILER --------------------
+def collapse_stack(frame, max_depth=64):
+    """Return a frame's stack as "file:function;file:function", outermost first."""
+    names = []
+    while frame is not None and len(names) < max_depth:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+class SamplingProfiler:
+    """
+    Samples the stacks of every thread at a fixed interval from a background thread.
+
+    Stacks are kept in collapsed form, ready for flame graph tools. The
+    profiler costs nothing until it is started.
+    """
+
+    def __init__(self):
+        self.interval = 0.01
+        self.samples = 0
+        self._stacks = Counter()
+        self._lock = threading.Lock()
+        # Serializes start and stop, separate from _lock so stop can join the sampler
+        self._control = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval=None):
+        with self._control:
+            if interval is not None:
+                self.interval = interval
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='hackerbot-profiler', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._control:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+    def reset(self):
+        with self._lock:
+            self._stacks.clear()
+            self.samples = 0
+
+    def report(self, limit=50):
+        with self._lock:
+            stacks = self._stacks.most_common(limit)
+            samples = self.samples
+        return {
+            'running': self.running,
+            'interval_ms': self.interval * 1000,
+            'samples': samples,
+            'stacks': [{'stack': stack, 'count': count} for stack, count in stacks],
+        }
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            stacks = [collapse_stack(frame) for thread_id, frame in frames.items() if thread_id != own_id]
+            with self._lock:
+                self._stacks.update(stacks)
+                self.samples += 1
+
+def get_slow_request_log():
+    return current_app.config.setdefault('SLOW_REQUESTS', SlowRequestLog(current_app.config.get('SLOW_REQUEST_LOG_SIZE', 50)))
+
+def get_profiler():
+    return current_app.config.setdefault('PROFILER', SamplingProfiler())
@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.01
+# Updated:    2026.10.18
 #
 # This script registers the routes for the Flask application.
 #
@@ -18,8 +18,15 @@
 from app.routes import status
 from app.routes import mapping
 from app.routes import action
+from app.routes import fleet
+from app.routes import debug
+from app.routes import config
 
 def register_routes(app):
     app.register_blueprint(status.bp)
     app.register_blueprint(mapping.bp)
     app.register_blueprint(action.bp)
+    app.register_blueprint(fleet.bp)
+    app.register_blueprint(debug.bp)
+    app.register_blueprint(config.bp)
+    app.register_blueprint(action.bp, name='fleet_action', url_prefix='/api/v1/robots/<robot_id>')
@@ -1,159 +1,182 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, g
+from app.dispatch import get_dispatcher, QUERY, URGENT, COMMAND
+from app.routes.mapping import map_data_db
 
-bp = Blueprint('action', __name__)
+# Also registered under /api/v1/robots/<robot_id> in fleet mode
+bp = Blueprint('action', __name__, url_prefix='/api/v1')
+
+@bp.url_value_preprocessor
+def pull_robot_id(endpoint, values):
+    g.robot_id = values.pop('robot_id', None) if values else None
 
 # -------------------- CORE --------------------
-@bp.route('/api/v1/core', methods=['POST'])
+@bp.route('/core', methods=['POST'])
 def core_post():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
     if not data or 'method' not in data:
         return jsonify({'error': 'Missing method'}), 400
 
     if data['method'] == 'ping':
-        result = robot.core.ping()
+        command = robot.core.ping
     elif data['method'] == 'settings':
-        result = True
-        if 'json-responses' in data:
-            result &= robot.set_json_mode(data['json-responses'])
-        if 'tofs-enabled' in data:
-            result &= robot.set_TOFs(data['tofs-enabled'])
+        def command():
+            result = True
+            if 'json-responses' in data:
+                result &= robot.set_json_mode(data['json-responses'])
+            if 'tofs-enabled' in data:
+                result &= robot.set_TOFs(data['tofs-enabled'])
+            return result
     else:
         return jsonify({'error': 'Invalid method'}), 400
 
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    lane = QUERY if data['method'] == 'ping' else COMMAND
+    return dispatcher.dispatch('core', data['method'], command, lane=lane).to_response()
 
-@bp.route('/api/v1/core/version', methods=['GET'])
+@bp.route('/core/version', methods=['GET'])
 def core_version():
-    robot = current_app.config['ROBOT']
-    result = robot.core.version()
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
+    return dispatcher.dispatch('core', 'version', robot.core.version, lane=QUERY).to_response()
 
 # -------------------- BASE --------------------
-@bp.route('/api/v1/base', methods=['POST'])
+@bp.route('/base', methods=['POST'])
 def base_post():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
     if not data or 'method' not in data:
         return jsonify({'error': 'Missing method'}), 400
 
     method = data['method']
     if method == 'initialize':
-        result = robot.base.initialize()
+        command = robot.base.initialize
     elif method == 'mode':
-        result = robot.base.set_mode(data.get('mode_id'))
+        command = lambda: robot.base.set_mode(data.get('mode_id'))
     elif method == 'start':
-        result = robot.base.start()
+        command = robot.base.start
     elif method == 'quickmap':
-        result = robot.base.quickmap()
+        command = robot.base.quickmap
     elif method == 'dock':
-        result = robot.base.dock()
+        command = robot.base.dock
     elif method == 'kill':
-        result = robot.base.kill()
+        command = robot.base.kill
     elif method == 'trigger-bump':
-        result = robot.base.trigger_bump(data.get('left'), data.get('right'))
+        command = lambda: robot.base.trigger_bump(data.get('left'), data.get('right'))
     elif method == 'speak':
-        result = robot.base.speak(data.get('model_src'), data.get('text'), data.get("speaker_id"))
+        command = lambda: robot.base.speak(data.get('model_src'), data.get('text'), data.get("speaker_id"))
     else:
         return jsonify({'error': 'Invalid method'}), 400
 
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    # Kill has to stop the robot while a blocking motion command is still running
+    outcome = dispatcher.dispatch('base', method, command, lane=URGENT if method == 'kill' else COMMAND)
+    if method == 'quickmap' and outcome.error is None:
+        # Maps are refetched on their next download and kept as a new version
+        map_data_db.invalidate(dispatcher.robot_id)
+    return outcome.to_response()
 
-@bp.route('/api/v1/base/status', methods=['GET'])
+@bp.route('/base/status', methods=['GET'])
 def base_status():
-    robot = current_app.config['ROBOT']
-    result = robot.base.status()
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
+    return dispatcher.dispatch('base', 'status', robot.base.status, lane=QUERY).to_response()
 
-@bp.route('/api/v1/base/actions', methods=['POST'])
+@bp.route('/base/actions', methods=['POST'])
 def base_drive():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
-    result = robot.base.drive(data.get('linear_velocity'), data.get('angle_velocity'))
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    command = lambda: robot.base.drive(data.get('linear_velocity'), data.get('angle_velocity'))
+    return dispatcher.dispatch('base', 'drive', command).to_response()
 
-@bp.route('/api/v1/base/maps/position', methods=['GET'])
+@bp.route('/base/maps/position', methods=['GET'])
 def base_position():
-    robot = current_app.config['ROBOT']
-    result = robot.base.maps.position()
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
+    return dispatcher.dispatch('maps', 'position', robot.base.maps.position, lane=QUERY).to_response()
 
-@bp.route('/api/v1/base/maps', methods=['POST'])
+@bp.route('/base/maps', methods=['POST'])
 def base_goto():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
     method = data.get('method')
     if method == 'goto':
-        print(data)
         if data.get('x') is None or data.get('y') is None:
             return jsonify({'error': 'Missing parameters'}), 400
-        result = robot.base.maps.goto(data.get('x'), data.get('y'), data.get('angle'), data.get('speed'))
-        return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+        command = lambda: robot.base.maps.goto(data.get('x'), data.get('y'), data.get('angle'), data.get('speed'))
+        return dispatcher.dispatch('maps', method, command).to_response()
+    return jsonify({'error': 'Invalid method'}), 400
 
 # -------------------- HEAD --------------------
-@bp.route('/api/v1/head', methods=['PUT'])
+@bp.route('/head', methods=['PUT'])
 def head_settings():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
-    result = robot.head.set_idle_mode(data.get('idle-mode'))
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    command = lambda: robot.head.set_idle_mode(data.get('idle-mode'))
+    return dispatcher.dispatch('head', 'idle-mode', command).to_response()
 
-@bp.route('/api/v1/head', methods=['POST'])
+@bp.route('/head', methods=['POST'])
 def head_command():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
     method = data.get('method')
 
     if method == 'look':
-        result = robot.head.look(data.get('yaw'), data.get('pitch'), data.get('speed'))
+        command = lambda: robot.head.look(data.get('yaw'), data.get('pitch'), data.get('speed'))
     elif method == 'gaze':
-        result = robot.head.eyes.gaze(data.get('x'), data.get('y'))
+        command = lambda: robot.head.eyes.gaze(data.get('x'), data.get('y'))
     else:
         return jsonify({'error': 'Invalid method'}), 400
 
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    return dispatcher.dispatch('head', method, command).to_response()
 
-@bp.route('/api/v1/head/position', methods=['GET'])
+@bp.route('/head/position', methods=['GET'])
 def head_position():
-    robot = current_app.config['ROBOT']
-    result = robot.head.get_position()
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
+    return dispatcher.dispatch('head', 'position', robot.head.get_position, lane=QUERY).to_response()
 
 # -------------------- ARM --------------------
-@bp.route('/api/v1/arm/gripper', methods=['POST'])
+@bp.route('/arm/gripper', methods=['POST'])
 def gripper_command():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
     method = data.get('method')
 
     if method == 'calibrate':
-        result = robot.arm.gripper.calibrate()
+        command = robot.arm.gripper.calibrate
     elif method == 'open':
-        result = robot.arm.gripper.open()
+        command = robot.arm.gripper.open
     elif method == 'close':
-        result = robot.arm.gripper.close()
+        command = robot.arm.gripper.close
     else:
         return jsonify({'error': 'Invalid method'}), 400
 
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    return dispatcher.dispatch('gripper', method, command).to_response()
 
-@bp.route('/api/v1/arm', methods=['POST'])
+@bp.route('/arm', methods=['POST'])
 def arm_command():
-    robot = current_app.config['ROBOT']
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
     data = request.get_json()
     method = data.get('method')
 
     if method == 'move-joint':
-        result = robot.arm.move_joint(data.get('joint'), data.get('angle'), data.get('speed'))
+        command = lambda: robot.arm.move_joint(data.get('joint'), data.get('angle'), data.get('speed'))
     elif method == 'move-joints':
-        result = robot.arm.move_joints(data.get('angles'), data.get('speed'))
+        command = lambda: robot.arm.move_joints(data.get('angles'), data.get('speed'))
     else:
         return jsonify({'error': 'Invalid method'}), 400
 
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    return dispatcher.dispatch('arm', method, command).to_response()
 
-@bp.route('/api/v1/arm/position', methods=['GET'])
+@bp.route('/arm/position', methods=['GET'])
 def arm_position():
-    robot = current_app.config['ROBOT']
-    result = robot.arm.get_position()
-    return jsonify({'response': result}) if result else jsonify({'error': robot.get_error()})
+    dispatcher = get_dispatcher()
+    robot = dispatcher.robot
+    return dispatcher.dispatch('arm', 'position', robot.arm.get_position, lane=QUERY).to_response()
@@ -0,0 +1,90 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script contains the runtime settings API endpoints.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import threading
+from flask import Blueprint, jsonify, current_app, request
+from app.config import SETTINGS, ConfigError, read_sources, validate
+from app.dispatch import get_error_log
+from app.profiling import get_slow_request_log
+from app.routes.mapping import map_data_db
+
+bp = Blueprint('config', __name__)
+
+reload_lock = threading.Lock()
+
+def apply_settings(values):
+    """Store reloadable values in app.config and push them to the objects created from them."""
+    config = current_app.config
+    config.update(values)
+    if 'DISPATCH_TIMEOUT' in values:
+        dispatchers = config['FLEET'].dispatchers() if 'FLEET' in config else []
+        if config.get('DISPATCHER') is not None:
+            dispatchers.append(config['DISPATCHER'])
+        for dispatcher in dispatchers:
+            dispatcher.timeout = values['DISPATCH_TIMEOUT']
+    if 'ERROR_LOG_SIZE' in values:
+        get_error_log().resize(values['ERROR_LOG_SIZE'])
+    if 'SLOW_REQUEST_LOG_SIZE' in values:
+        get_slow_request_log().resize(values['SLOW_REQUEST_LOG_SIZE'])
+    if 'MAP_VERSIONS' in values or 'MAP_CACHE_SIZE' in values:
+        map_data_db.trim(config.get('MAP_VERSIONS', 4), config.get('MAP_CACHE_SIZE'))
+
+def update_settings(values):
+    """Apply the values that changed, returning them and the names that need a restart."""
+    changed = {name: value for name, value in values.items() if current_app.config.get(name) != value}
+    restart_required = sorted(name for name in changed if not SETTINGS[name].reloadable)
+    reloaded = {name: value for name, value in changed.items() if SETTINGS[name].reloadable}
+    apply_settings(reloaded)
+    return reloaded, restart_required
+
+def settings_response():
+    return {name: setting.to_dict(current_app.config.get(name, setting.default))
+            for name, setting in SETTINGS.items()}
+
+@bp.route('/api/v1/config', methods=['GET'])
+def get_config():
+    return jsonify({'config': settings_response()})
+
+@bp.route('/api/v1/config', methods=['PUT'])
+def put_config():
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data, dict):
+        return jsonify({'error': 'Missing settings'}), 400
+
+    fixed = sorted(name for name in data if name in SETTINGS and not SETTINGS[name].reloadable)
+    if fixed:
+        return jsonify({'error': 'Settings require a restart', 'settings': fixed}), 400
+    try:
+        values = validate(data, names=data.keys(), allow_null=False)
+    except ConfigError as e:
+        return jsonify({'error': 'Invalid settings', 'settings': e.errors}), 400
+
+    with reload_lock:
+        changed, _ = update_settings(values)
+    return jsonify({'changed': changed, 'config': settings_response()})
+
+@bp.route('/api/v1/config/reload', methods=['POST'])
+def reload_config():
+    """Re-read the settings from the config file, .env and the environment."""
+    try:
+        values = validate(read_sources())
+    except ConfigError as e:
+        return jsonify({'error': 'Invalid settings', 'settings': e.errors}), 400
+
+    with reload_lock:
+        changed, restart_required = update_settings(values)
+    return jsonify({'changed': changed, 'restart_required': restart_required, 'config': settings_response()})
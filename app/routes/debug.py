@@ -0,0 +1,127 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script contains the profiling API endpoints and the request timing hooks.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import time
+from flask import Blueprint, jsonify, current_app, g, request
+from app.config import ConfigError, validate
+from app.profiling import (begin_request_spans, get_profiler, get_slow_request_log,
+                           server_timing, span, span_duration_ms, span_tree)
+from app.routes.config import reload_lock, update_settings
+
+bp = Blueprint('debug', __name__)
+
+@bp.before_app_request
+def start_request_timing():
+    if not current_app.config.get('PROFILING'):
+        return
+    g.request_span = begin_request_spans(f"{request.method} {request.path}")
+    if request.is_json:
+        # Parsed once here, routes reuse the cached result
+        with span('parse'):
+            request.get_json(silent=True)
+
+@bp.after_app_request
+def finish_request_timing(response):
+    root = g.pop('request_span', None)
+    if root is None:
+        return response
+    root['end'] = time.perf_counter()
+    response.headers['Server-Timing'] = server_timing(root)
+
+    duration_ms = span_duration_ms(root)
+    if duration_ms >= current_app.config.get('SLOW_REQUEST_MS', 1000):
+        get_slow_request_log().record({
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'status': response.status_code,
+            'timestamp': time.time(),
+            'duration_ms': duration_ms,
+            'spans': span_tree(root),
+        })
+    return response
+
+@bp.route('/api/debug/slow', methods=['GET'])
+def get_slow_requests():
+    return jsonify({
+        'threshold_ms': current_app.config.get('SLOW_REQUEST_MS', 1000),
+        'requests': get_slow_request_log().list()
+    })
+
+@bp.route('/api/debug/slow', methods=['DELETE'])
+def clear_slow_requests():
+    get_slow_request_log().clear()
+    return jsonify({'requests': []})
+
+@bp.route('/api/debug/profiler', methods=['GET'])
+def get_profile():
+    limit = request.args.get('limit', 50, type=int)
+    report = get_profiler().report(limit)
+    report['spans'] = bool(current_app.config.get('PROFILING'))
+    return jsonify(report)
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+# Profiler fields that are runtime settings, validated and applied like /api/v1/config
+SETTING_FIELDS = {'spans': 'PROFILING', 'slow_threshold_ms': 'SLOW_REQUEST_MS'}
+
+def validate_profiler_settings(data):
+    """Return (settings, errors), errors maps every invalid field to its message."""
+    errors = {}
+    for field in ('spans', 'enabled', 'reset'):
+        if field in data and not isinstance(data[field], bool):
+            errors[field] = "expected a boolean"
+    if 'slow_threshold_ms' in data and not is_number(data['slow_threshold_ms']):
+        errors['slow_threshold_ms'] = "expected a number"
+
+    settings = {}
+    raw = {name: data[field] for field, name in SETTING_FIELDS.items() if field in data and field not in errors}
+    try:
+        settings = validate(raw, names=raw.keys(), allow_null=False)
+    except ConfigError as e:
+        fields = {name: field for field, name in SETTING_FIELDS.items()}
+        errors.update({fields[name]: message for name, message in e.errors.items()})
+
+    # Shorter intervals would turn the sampler into a busy loop
+    if data.get('interval_ms') is not None and not (is_number(data['interval_ms']) and data['interval_ms'] >= 1):
+        errors['interval_ms'] = "expected a number of at least 1"
+    return settings, errors
+
+@bp.route('/api/debug/profiler', methods=['POST'])
+def set_profiler():
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data, dict):
+        return jsonify({'error': 'Missing settings'}), 400
+    settings, errors = validate_profiler_settings(data)
+    if errors:
+        return jsonify({'error': 'Invalid settings', 'settings': errors}), 400
+
+    profiler = get_profiler()
+    with reload_lock:
+        update_settings(settings)
+    if data.get('reset'):
+        profiler.reset()
+    if 'enabled' in data:
+        interval_ms = data.get('interval_ms')
+        if data['enabled']:
+            profiler.start(interval_ms / 1000 if interval_ms else None)
+        else:
+            profiler.stop()
+
+    report = profiler.report(limit=0)
+    report['spans'] = bool(current_app.config.get('PROFILING'))
+    return jsonify(report)
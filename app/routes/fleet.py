@@ -0,0 +1,44 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script contains the fleet-wide API endpoints.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+from flask import Blueprint, jsonify, current_app
+
+bp = Blueprint('fleet', __name__)
+
+def gather_response(subsystem, method, select):
+    fleet = current_app.config['FLEET']
+    # A robot busy with a motion command must not hold up the whole fleet
+    outcomes = fleet.gather(subsystem, method, select, current_app.config.get('FLEET_TIMEOUT', 2.0))
+    robots = {}
+    for robot_id, outcome in outcomes.items():
+        if outcome.error is not None:
+            robots[robot_id] = {'error': outcome.error.to_dict()}
+        else:
+            robots[robot_id] = {'response': outcome.result}
+    return jsonify({'robots': robots})
+
+@bp.route('/api/v1/robots', methods=['GET'])
+def list_robots():
+    return jsonify({'robots': current_app.config['FLEET'].ids()})
+
+@bp.route('/api/v1/robots/status', methods=['GET'])
+def fleet_status():
+    return gather_response('base', 'status', lambda robot: robot.base.status)
+
+@bp.route('/api/v1/robots/positions', methods=['GET'])
+def fleet_positions():
+    return gather_response('maps', 'position', lambda robot: robot.base.maps.position)
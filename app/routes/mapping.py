@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.01
+# Updated:    2026.10.18
 #
 # This script contains the mapping API endpoints.
 #
@@ -15,40 +15,140 @@
 ################################################################################
 
 
-from flask import Blueprint, jsonify, current_app, request
+import json
+from flask import Blueprint, Response, jsonify, current_app, g, request
+from app.dispatch import get_dispatcher, QUERY
+from app.errors import NOT_FOUND
+from app.maps import MapStore, diff_tiles
 
 bp = Blueprint('mapping_data', __name__)
 
-# Initialize storage dictionaries
-map_data_db = {}
+# Initialize storage dictionaries, keyed by (robot_id, map_id)
+map_data_db = MapStore()
 markers_db = {}
 
+@bp.url_value_preprocessor
+def pull_robot_id(endpoint, values):
+    g.robot_id = values.pop('robot_id', None) if values else None
+
+def current_robot_id():
+    """Id of the robot addressed by the request, the configured robot outside fleet routes."""
+    robot_id = g.get('robot_id')
+    if robot_id is None and current_app.config.get('DISPATCHER') is not None:
+        robot_id = current_app.config['DISPATCHER'].robot_id
+    return robot_id
+
+def robot_configured():
+    return g.get('robot_id') is not None or current_app.config.get('DISPATCHER') is not None
+
+def iter_chunks(data, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+def iter_map_json(map_id, map_data, chunk_size):
+    """Yield the same document as jsonify, escaping the map data one chunk at a time."""
+    if not isinstance(map_data, str):
+        yield json.dumps({"map_id": map_id, "map_data": map_data})
+        return
+    yield f'{{"map_id": {map_id}, "map_data": "'
+    for chunk in iter_chunks(map_data, chunk_size):
+        yield json.dumps(chunk)[1:-1]
+    yield '"}'
+
+def iter_map_bytes(map_data, chunk_size):
+    if isinstance(map_data, str):
+        for chunk in iter_chunks(map_data, chunk_size):
+            yield chunk.encode()
+    else:
+        yield from iter_chunks(memoryview(map_data), chunk_size)
+
 @bp.route('/api/v1/base/maps', methods=['GET'])
-def get_map_list():        
-    robot = current_app.config.get('ROBOT')
-    map_list = robot.base.maps.list()
-    if map_list is None:
-        return jsonify({"error": "No map list found"}), 404
-    return jsonify({"map_list": map_list})
+@bp.route('/api/v1/robots/<robot_id>/base/maps', methods=['GET'])
+def get_map_list():
+    if not robot_configured():
+        return jsonify({"error": "Robot not configured"}), 500
+    dispatcher = get_dispatcher()
+    outcome = dispatcher.dispatch('maps', 'list', dispatcher.robot.base.maps.list, lane=QUERY,
+                                  ok=lambda map_list: map_list is not None,
+                                  failure_code=NOT_FOUND, failure_message="No map list found")
+    if outcome.error is not None:
+        return outcome.to_response()
+    return jsonify({"map_list": outcome.result})
+
+def load_map(map_id):
+    """Return (version, map_data, None), or (None, None, error response) if the map can't be fetched."""
+    if not robot_configured():
+        return None, None, (jsonify({"error": "Robot not configured"}), 500)
+    dispatcher = get_dispatcher()
+    key = (current_robot_id(), map_id)
+    if key not in map_data_db:
+        outcome = dispatcher.dispatch('maps', 'fetch', dispatcher.robot.base.maps.fetch, map_id, lane=QUERY,
+                                      ok=lambda map_data: map_data is not None,
+                                      failure_code=NOT_FOUND, failure_message=f"Map data not found: {map_id}")
+        if outcome.error is not None:
+            return None, None, outcome.to_response()
+        map_data_db.put(key, outcome.result, current_app.config.get('MAP_VERSIONS', 4),
+                        current_app.config.get('MAP_CACHE_SIZE'))
+    version, map_data = map_data_db.latest(key)
+    return version, map_data, None
+
+def stream_map(map_id, version, map_data):
+    # Stream from the cache so memory per download is bounded by the chunk size
+    chunk_size = current_app.config.get('MAP_CHUNK_SIZE', 64 * 1024)
+    headers = {'X-Map-Version': str(version)}
+    mimetype = request.accept_mimetypes.best_match(['application/json', 'application/octet-stream'])
+    if mimetype == 'application/octet-stream':
+        return Response(iter_map_bytes(map_data, chunk_size), mimetype=mimetype, headers=headers)
+    return Response(iter_map_json(map_id, map_data, chunk_size), mimetype='application/json', headers=headers)
 
 @bp.route('/api/v1/base/maps/<int:selected_map_id>', methods=['GET'])
+@bp.route('/api/v1/robots/<robot_id>/base/maps/<int:selected_map_id>', methods=['GET'])
 def get_compressed_map_data(selected_map_id):
+    version, map_data, error = load_map(selected_map_id)
+    if error:
+        return error
+    return stream_map(selected_map_id, version, map_data)
+
+@bp.route('/api/v1/base/maps/<int:selected_map_id>/diff', methods=['GET'])
+@bp.route('/api/v1/robots/<robot_id>/base/maps/<int:selected_map_id>/diff', methods=['GET'])
+def get_map_diff(selected_map_id):
+    """
+    Return the tiles that changed since version "from" as [index, data] pairs.
+
+    The new map is old[:length] with every listed tile written at index * tile_size.
+    When the base version is no longer kept, or most of the map changed, the
+    full map is sent instead, the same way as the plain map download.
+
+    Tiles are compared at the same offsets, so an edit that inserts or removes
+    characters shifts every later tile of the compressed map and such updates
+    mostly fall back to the full map.
+    """
+    base_version = request.args.get('from', type=int)
+    version, map_data, error = load_map(selected_map_id)
+    if error:
+        return error
+
+    base = map_data_db.get((current_robot_id(), selected_map_id), base_version)
+    if not isinstance(base, str) or not isinstance(map_data, str):
+        return stream_map(selected_map_id, version, map_data)
 
-    if selected_map_id not in map_data_db:
-        robot = current_app.config.get('ROBOT')
-        if not robot:
-            return jsonify({"error": "Robot not configured"}), 500
-        map_data = robot.base.maps.fetch(selected_map_id)
-        if map_data is None:
-            return jsonify({"error": f"Map data not found: {selected_map_id}"}), 404
-        map_data_db[selected_map_id] = map_data
+    tile_size = current_app.config.get('MAP_TILE_SIZE', 1024)
+    changed = diff_tiles(base, map_data, tile_size)
+    if len(changed) * tile_size >= len(map_data) > 0:
+        return stream_map(selected_map_id, version, map_data)
 
+    tiles = [[int(i), map_data[i * tile_size:(i + 1) * tile_size]] for i in changed]
     return jsonify({
-        "map_id": selected_map_id, 
-        "map_data": map_data_db[selected_map_id]
-    })
+        "map_id": selected_map_id,
+        "from": base_version,
+        "version": version,
+        "length": len(map_data),
+        "tile_size": tile_size,
+        "tiles": tiles
+    }), 200, {'X-Map-Version': str(version)}
 
 @bp.route('/api/save-markers', methods=['POST'])
+@bp.route('/api/v1/robots/<robot_id>/save-markers', methods=['POST'])
 def save_markers():
     try:
         data = request.json  # Get JSON data from the frontend
@@ -58,7 +158,7 @@ def save_markers():
         if map_id is None:
             return jsonify({"error": "map_id is required"}), 200
             
-        markers_db[map_id] = markers  # Store markers for specific map_id
+        markers_db[(current_robot_id(), map_id)] = markers  # Store markers for specific map_id
 
         return jsonify({
             "map_id": map_id,
@@ -68,9 +168,11 @@ def save_markers():
         return jsonify({"error": str(e)}), 200
 
 @bp.route('/api/load-markers/<int:map_id>', methods=['GET'])
+@bp.route('/api/v1/robots/<robot_id>/load-markers/<int:map_id>', methods=['GET'])
 def load_markers(map_id):
     try:
-        if map_id not in markers_db:
+        key = (current_robot_id(), map_id)
+        if key not in markers_db:
             return jsonify({
                 "map_id": map_id,
                 "markers": []
@@ -78,7 +180,7 @@ def load_markers(map_id):
             
         return jsonify({
             "map_id": map_id,
-            "markers": markers_db[map_id]
+            "markers": markers_db[key]
         }), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 200
@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.01
+# Updated:    2026.10.18
 #
 # This script contains the status API endpoints.
 #
@@ -15,7 +15,8 @@
 ################################################################################
 
 
-from flask import Blueprint, jsonify, current_app
+from flask import Blueprint, jsonify, current_app, request
+from app.dispatch import get_error_log
 
 bp = Blueprint('status', __name__)
 
@@ -27,6 +28,17 @@ def get_status():
 
 @bp.route('/api/error', methods=['GET'])
 def get_error():
-    robot = current_app.config['ROBOT']
-    error = robot.get_error()
-    return jsonify({"error": error})
+    since = request.args.get('since', type=int)
+    subsystem = request.args.get('subsystem')
+    robot_id = request.args.get('robot_id')
+    error_log = get_error_log()
+    errors = error_log.query(since=since, subsystem=subsystem, robot_id=robot_id)
+
+    # Keep the last error message for clients that only read "error"
+    latest = error_log.latest()
+    if latest is not None:
+        error = latest.message
+    else:
+        robot = current_app.config['ROBOT']
+        error = robot.get_error()
+    return jsonify({"error": error, "errors": [e.to_dict() for e in errors]})
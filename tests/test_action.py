@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.11
+# Updated:    2026.10.18
 #
 # This script tests the action API endpoints.
 #
@@ -20,10 +20,15 @@ from unittest.mock import MagicMock
 from flask import Flask
 import sys
 import os
+import threading
+import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.routes.action import bp
+from app.routes.mapping import map_data_db
+from app.dispatch import Dispatcher
+from app.errors import ErrorLog
 
 class TestActionAPI(unittest.TestCase):
 
@@ -63,6 +68,11 @@ class TestActionAPI(unittest.TestCase):
         self.mock_robot.get_error.return_value = 'Some error'
         self.app = self.__class__.app
         self.app.config['ROBOT'] = self.mock_robot
+        self.app.config['ERROR_LOG'] = ErrorLog()
+        self.app.config['DISPATCHER'] = Dispatcher(self.mock_robot, self.app.config['ERROR_LOG'], timeout=5)
+
+    def tearDown(self):
+        self.app.config['DISPATCHER'].shutdown()
 
     def test_core_ping(self):
         response = self.client.post('/api/v1/core', json={'method': 'ping'})
@@ -116,6 +126,91 @@ class TestActionAPI(unittest.TestCase):
         response = self.client.post('/api/v1/base', json={'method': 'mode', 'mode_id': 'explore'})
         self.assertEqual(response.status_code, 200)
 
+    def test_base_quickmap_invalidates_maps(self):
+        self.mock_robot.base.quickmap.return_value = True
+        map_data_db.put((None, 1), 'map1')
+        map_data_db.put(('other-robot', 1), 'map1')
+        response = self.client.post('/api/v1/base', json={'method': 'quickmap'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn((None, 1), map_data_db)
+        self.assertIn(('other-robot', 1), map_data_db)
+
+    def test_base_kill_during_goto(self):
+        order = []
+        goto_started = threading.Event()
+        release = threading.Event()
+        def goto(*args):
+            goto_started.set()
+            release.wait(2)
+            order.append('goto')
+            return 'arrived'
+        self.mock_robot.base.maps.goto.side_effect = goto
+        self.mock_robot.base.kill.side_effect = lambda: order.append('kill') or 'killed'
+
+        goto_thread = threading.Thread(target=self.client.post, args=('/api/v1/base/maps',),
+                                       kwargs={'json': {'method': 'goto', 'x': 1.0, 'y': 2.0}})
+        goto_thread.start()
+        goto_started.wait(2)
+        response = self.client.post('/api/v1/base', json={'method': 'kill'})
+        release.set()
+        goto_thread.join()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(order, ['kill', 'goto'])
+
+    def test_timed_out_query_dropped(self):
+        release = threading.Event()
+        self.app.config['DISPATCHER'] = Dispatcher(self.mock_robot, ErrorLog(), timeout=0.05, query_workers=1)
+        self.mock_robot.base.maps.position.side_effect = lambda: release.wait(2) or {'x': 1}
+        try:
+            position_thread = threading.Thread(target=self.client.get, args=('/api/v1/base/maps/position',))
+            position_thread.start()
+            time.sleep(0.01)
+            response = self.client.get('/api/v1/base/status')
+        finally:
+            release.set()
+            position_thread.join()
+
+        self.assertEqual(response.status_code, 504)
+        self.assertIn('command dropped', response.json['error']['message'])
+        self.app.config['DISPATCHER'].dispatch('base', 'noop', lambda: True, lane='query')
+        self.mock_robot.base.status.assert_not_called()
+
+    def test_query_during_goto(self):
+        goto_started = threading.Event()
+        release = threading.Event()
+        def goto(*args):
+            goto_started.set()
+            release.wait(2)
+            return 'arrived'
+        self.mock_robot.base.maps.goto.side_effect = goto
+        self.app.config['DISPATCHER'].timeout = 0.5
+
+        goto_thread = threading.Thread(target=self.client.post, args=('/api/v1/base/maps',),
+                                       kwargs={'json': {'method': 'goto', 'x': 1.0, 'y': 2.0}})
+        goto_thread.start()
+        goto_started.wait(2)
+        response = self.client.get('/api/v1/base/maps/position')
+        release.set()
+        goto_thread.join()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['response'], {'x': 1, 'y': 2, 'angle': 90})
+
+    def test_motion_command_not_timed_out(self):
+        self.app.config['DISPATCHER'].timeout = 0.05
+        self.mock_robot.base.dock.side_effect = lambda: time.sleep(0.2) or 'docked'
+        response = self.client.post('/api/v1/base', json={'method': 'dock'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['response'], 'docked')
+
+    def test_stale_error_not_reported(self):
+        self.mock_robot.head.look.return_value = False
+        self.mock_robot.get_error.return_value = 'Error from an earlier command'
+        response = self.client.post('/api/v1/head', json={'method': 'look', 'yaw': 1.0, 'pitch': 2.0, 'speed': 0.5})
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(response.json['error']['message'], 'head look failed')
+
     def test_base_speak_valid(self):
         response = self.client.post('/api/v1/base', json={'method': 'speak', 'text': 'Hello Test World!', "model_src": "en_US-amy-low"})
         self.assertEqual(response.status_code, 200)
@@ -174,6 +269,33 @@ class TestActionAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json['response'], 'joints moved')
 
+    def test_arm_move_joint_failure(self):
+        self.mock_robot.arm.move_joint.return_value = False
+        self.mock_robot.get_error.side_effect = ['', 'Joint out of range']
+        response = self.client.post('/api/v1/arm', json={'method': 'move-joint', 'joint': 'shoulder', 'angle': 300.0, 'speed': 0.5})
+        self.assertEqual(response.status_code, 502)
+        error = response.json['error']
+        self.assertEqual(error['code'], 'command_failed')
+        self.assertEqual(error['subsystem'], 'arm')
+        self.assertEqual(error['method'], 'move-joint')
+        self.assertEqual(error['message'], 'Joint out of range')
+        self.assertIn('latency_ms', error)
+
+    def test_base_start_exception(self):
+        self.mock_robot.base.start.side_effect = RuntimeError('Serial port closed')
+        response = self.client.post('/api/v1/base', json={'method': 'start'})
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json['error']['code'], 'command_exception')
+        self.assertEqual(response.json['error']['message'], 'Serial port closed')
+
+    def test_failure_recorded_in_error_log(self):
+        self.mock_robot.head.look.return_value = False
+        self.mock_robot.get_error.return_value = 'Head not responding'
+        response = self.client.post('/api/v1/head', json={'method': 'look', 'yaw': 1.0, 'pitch': 2.0, 'speed': 0.5})
+        latest = self.app.config['ERROR_LOG'].latest()
+        self.assertEqual(latest.id, response.json['error']['id'])
+        self.assertEqual(latest.subsystem, 'head')
+
     # def test_arm_position(self):
     #     response = self.client.get('/api/v1/arm/position')
     #     self.assertEqual(response.status_code, 200)
@@ -0,0 +1,149 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script tests the runtime settings and their API endpoints.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import unittest
+from unittest.mock import MagicMock, patch
+from flask import Flask
+import json
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.config import ConfigError, load_settings
+from app.dispatch import Dispatcher
+from app.errors import ErrorLog
+from app.routes.config import bp
+from app.routes.mapping import map_data_db
+
+class TestConfigAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(bp)
+        cls.app.testing = True
+        cls.client = cls.app.test_client()
+
+    def setUp(self):
+        self.app.config.update(load_settings({}))
+        self.app.config['ERROR_LOG'] = ErrorLog(self.app.config['ERROR_LOG_SIZE'])
+        self.dispatcher = Dispatcher(MagicMock(), self.app.config['ERROR_LOG'], self.app.config['DISPATCH_TIMEOUT'])
+        self.app.config['DISPATCHER'] = self.dispatcher
+
+    def test_load_settings_defaults(self):
+        settings = load_settings({})
+        self.assertEqual(settings['DISPATCH_TIMEOUT'], 30.0)
+        self.assertFalse(settings['PROFILING'])
+
+    def test_load_settings_typed(self):
+        settings = load_settings({'MAP_CHUNK_SIZE': '1024', 'PROFILING': 'yes'})
+        self.assertEqual(settings['MAP_CHUNK_SIZE'], 1024)
+        self.assertTrue(settings['PROFILING'])
+
+    def test_load_settings_invalid(self):
+        with self.assertRaises(ConfigError) as context:
+            load_settings({'MAP_CHUNK_SIZE': 'big', 'DISPATCH_TIMEOUT': '0'})
+        self.assertEqual(set(context.exception.errors), {'MAP_CHUNK_SIZE', 'DISPATCH_TIMEOUT'})
+
+    def test_load_settings_file(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump({'MAP_VERSIONS': 8, 'MAP_TILE_SIZE': 256}, f)
+        try:
+            settings = load_settings({'HACKERBOT_CONFIG': f.name, 'MAP_TILE_SIZE': '512'})
+        finally:
+            os.unlink(f.name)
+        self.assertEqual(settings['MAP_VERSIONS'], 8)
+        self.assertEqual(settings['MAP_TILE_SIZE'], 512)
+
+    def test_get_config(self):
+        response = self.client.get('/api/v1/config')
+        self.assertEqual(response.status_code, 200)
+        config = response.json['config']
+        self.assertEqual(config['DISPATCH_TIMEOUT']['value'], 30.0)
+        self.assertTrue(config['DISPATCH_TIMEOUT']['reloadable'])
+        self.assertEqual(config['SECRET_KEY']['value'], '********')
+
+    def test_put_config(self):
+        response = self.client.put('/api/v1/config', json={'DISPATCH_TIMEOUT': '5', 'ERROR_LOG_SIZE': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['changed'], {'DISPATCH_TIMEOUT': 5.0, 'ERROR_LOG_SIZE': 2})
+        self.assertEqual(self.dispatcher.timeout, 5.0)
+        self.assertEqual(self.app.config['ERROR_LOG']._errors.maxlen, 2)
+
+    def test_put_config_not_reloadable(self):
+        response = self.client.put('/api/v1/config', json={'HACKERBOT_FLEET': 'alpha'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json['settings'], ['HACKERBOT_FLEET'])
+
+    def test_put_config_invalid(self):
+        response = self.client.put('/api/v1/config', json={'MAP_TILE_SIZE': -1, 'POLL_RATE': 5})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json['settings']), {'MAP_TILE_SIZE', 'POLL_RATE'})
+        self.assertEqual(self.app.config['MAP_TILE_SIZE'], 1024)
+
+    def test_put_config_null(self):
+        response = self.client.put('/api/v1/config', json={'DISPATCH_TIMEOUT': None})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json['settings'], {'DISPATCH_TIMEOUT': 'must not be null'})
+        self.assertEqual(self.dispatcher.timeout, 30.0)
+
+    def test_put_config_not_object(self):
+        for body in (['DISPATCH_TIMEOUT'], 'DISPATCH_TIMEOUT', 5):
+            response = self.client.put('/api/v1/config', json=body)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json['error'], 'Missing settings')
+
+    def test_load_settings_numbers(self):
+        for raw in ('nan', 'inf', '-inf', float('nan'), True, 'true'):
+            with self.assertRaises(ConfigError) as context:
+                load_settings({'DISPATCH_TIMEOUT': raw})
+            self.assertIn('DISPATCH_TIMEOUT', context.exception.errors)
+        for raw in (2.9, '2.9', True, 'abc'):
+            with self.assertRaises(ConfigError) as context:
+                load_settings({'MAP_VERSIONS': raw})
+            self.assertIn('MAP_VERSIONS', context.exception.errors)
+        for raw in (3, '3', 3.0, ' 3 '):
+            self.assertEqual(load_settings({'MAP_VERSIONS': raw})['MAP_VERSIONS'], 3)
+        self.assertEqual(load_settings({'DISPATCH_TIMEOUT': '2.5'})['DISPATCH_TIMEOUT'], 2.5)
+
+    def test_put_config_non_finite(self):
+        response = self.client.put('/api/v1/config', data='{"DISPATCH_TIMEOUT": NaN, "MAP_VERSIONS": true}',
+                                   content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json['settings']), {'DISPATCH_TIMEOUT', 'MAP_VERSIONS'})
+        self.assertEqual(self.dispatcher.timeout, 30.0)
+
+    def test_put_config_map_cache(self):
+        first = map_data_db.put(('config-robot', 1), 'a' * 8)
+        latest = map_data_db.put(('config-robot', 1), 'b' * 8)
+        response = self.client.put('/api/v1/config', json={'MAP_VERSIONS': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(map_data_db.get(('config-robot', 1), first))
+        self.assertEqual(map_data_db.get(('config-robot', 1), latest), 'b' * 8)
+
+    def test_reload_config(self):
+        with patch.dict(os.environ, {'SLOW_REQUEST_MS': '250', 'ROBOT_ID': 'alpha'}):
+            response = self.client.post('/api/v1/config/reload')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['changed'], {'SLOW_REQUEST_MS': 250.0})
+        self.assertEqual(response.json['restart_required'], ['ROBOT_ID'])
+        self.assertEqual(self.app.config['ROBOT_ID'], 'hackerbot')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script tests the profiling API endpoints.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import unittest
+from unittest.mock import MagicMock
+from flask import Flask
+import sys
+import os
+import time
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.routes import action, debug
+from app.profiling import SamplingProfiler, SlowRequestLog
+from app.dispatch import Dispatcher
+
+class TestDebugAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(action.bp)
+        cls.app.register_blueprint(debug.bp)
+        cls.app.testing = True
+        cls.client = cls.app.test_client()
+
+    def setUp(self):
+        self.mock_robot = MagicMock()
+        self.mock_robot.core.version.return_value = '1.0.0'
+        self.app.config['ROBOT'] = self.mock_robot
+        self.app.config['DISPATCHER'] = Dispatcher(self.mock_robot, timeout=5)
+        self.app.config['PROFILING'] = True
+        self.app.config['SLOW_REQUEST_MS'] = 1000
+        self.app.config['SLOW_REQUESTS'] = SlowRequestLog()
+
+    def test_server_timing(self):
+        self.mock_robot.arm.move_joint.return_value = 'joint moved'
+        response = self.client.post('/api/v1/arm', json={'method': 'move-joint', 'joint': 1, 'angle': 30.0, 'speed': 0.5})
+        self.assertEqual(response.status_code, 200)
+        names = [entry.split(';')[0] for entry in response.headers['Server-Timing'].split(', ')]
+        self.assertEqual(names, ['parse', 'dispatch', 'queue', 'hardware', 'serialize', 'total'])
+
+    def test_server_timing_disabled(self):
+        self.app.config['PROFILING'] = False
+        response = self.client.get('/api/v1/core/version')
+        self.assertNotIn('Server-Timing', response.headers)
+
+    def test_slow_request_captured(self):
+        def slow_move(*args):
+            time.sleep(0.05)
+            return 'joint moved'
+        self.mock_robot.arm.move_joint.side_effect = slow_move
+        self.app.config['SLOW_REQUEST_MS'] = 20
+
+        self.client.get('/api/v1/core/version')
+        self.client.post('/api/v1/arm', json={'method': 'move-joint', 'joint': 1, 'angle': 30.0, 'speed': 0.5})
+
+        response = self.client.get('/api/debug/slow')
+        self.assertEqual(response.status_code, 200)
+        requests = response.json['requests']
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0]['path'], '/api/v1/arm')
+        dispatch = requests[0]['spans']['children'][1]
+        self.assertEqual(dispatch['name'], 'dispatch')
+        hardware = dispatch['children'][1]
+        self.assertEqual(hardware['name'], 'hardware')
+        self.assertGreaterEqual(hardware['duration_ms'], 50)
+
+    def test_profiler_toggle(self):
+        response = self.client.post('/api/debug/profiler', json={'enabled': True, 'interval_ms': 1, 'reset': True})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json['running'])
+        time.sleep(0.05)
+
+        response = self.client.post('/api/debug/profiler', json={'enabled': False})
+        self.assertFalse(response.json['running'])
+
+        response = self.client.get('/api/debug/profiler')
+        self.assertGreater(response.json['samples'], 0)
+        self.assertTrue(response.json['stacks'])
+
+    def test_profiler_concurrent_start(self):
+        profiler = SamplingProfiler()
+        threads = [threading.Thread(target=profiler.start, args=(0.001,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            samplers = [thread for thread in threading.enumerate() if thread.name == 'hackerbot-profiler']
+            self.assertEqual(len(samplers), 1)
+        finally:
+            profiler.stop()
+        self.assertFalse(profiler.running)
+
+    def test_profiler_missing_settings(self):
+        response = self.client.post('/api/debug/profiler', json={})
+        self.assertEqual(response.status_code, 400)
+
+    def test_profiler_invalid_settings(self):
+        response = self.client.post('/api/debug/profiler', json={'slow_threshold_ms': 'abc'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('slow_threshold_ms', response.json['settings'])
+
+        response = self.client.post('/api/debug/profiler', data='{"slow_threshold_ms": NaN}',
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('slow_threshold_ms', response.json['settings'])
+
+        response = self.client.post('/api/debug/profiler', json={'enabled': True, 'interval_ms': '5'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('interval_ms', response.json['settings'])
+
+        response = self.client.post('/api/debug/profiler', json={'enabled': True, 'interval_ms': -1})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(self.client.get('/api/debug/profiler').json['running'])
+        self.assertEqual(self.app.config['SLOW_REQUEST_MS'], 1000)
+
+    def test_profiler_updates_settings(self):
+        response = self.client.post('/api/debug/profiler', json={'spans': False, 'slow_threshold_ms': 250})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.app.config['PROFILING'])
+        self.assertEqual(self.app.config['SLOW_REQUEST_MS'], 250.0)
+
+        response = self.client.post('/api/debug/profiler', json={'slow_threshold_ms': -5, 'spans': None})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json['settings']), {'slow_threshold_ms', 'spans'})
+        self.assertEqual(self.app.config['SLOW_REQUEST_MS'], 250.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+################################################################################
+# Copyright (c) 2025 Hackerbot Industries LLC
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+# Created By: Allen Chien
+# Created:    October 2026
+# Updated:    2026.10.18
+#
+# This script tests the fleet API endpoints.
+#
+# Special thanks to the following for their code contributions to this codebase:
+# Allen Chien - https://github.com/AllenChienXXX
+################################################################################
+
+
+import unittest
+from unittest.mock import MagicMock
+from flask import Flask
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.routes import action, fleet, mapping
+from app.dispatch import Dispatcher
+from app.errors import ErrorLog
+from app.fleet import Fleet, parse_fleet
+
+class TestFleetAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(fleet.bp)
+        cls.app.register_blueprint(mapping.bp)
+        cls.app.register_blueprint(action.bp, name='fleet_action', url_prefix='/api/v1/robots/<robot_id>')
+        cls.app.testing = True
+        cls.client = cls.app.test_client()
+
+    def setUp(self):
+        self.error_log = ErrorLog()
+        self.robots = {'alpha': MagicMock(), 'beta': MagicMock()}
+        self.fleet = Fleet()
+        for robot_id, robot in self.robots.items():
+            self.fleet.add(robot_id, Dispatcher(robot, self.error_log, robot_id=robot_id))
+        self.app.config['FLEET'] = self.fleet
+        self.app.config['DISPATCH_TIMEOUT'] = 5
+        self.app.config['FLEET_TIMEOUT'] = 5
+
+    def test_parse_fleet(self):
+        self.assertEqual(parse_fleet('alpha=/dev/ttyACM0, beta'), {'alpha': '/dev/ttyACM0', 'beta': None})
+        self.assertEqual(parse_fleet(''), {})
+
+    def test_list_robots(self):
+        response = self.client.get('/api/v1/robots')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {'robots': ['alpha', 'beta']})
+
+    def test_robot_command(self):
+        self.robots['beta'].core.ping.return_value = 'pong'
+        response = self.client.post('/api/v1/robots/beta/core', json={'method': 'ping'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {'response': 'pong'})
+        self.robots['alpha'].core.ping.assert_not_called()
+
+    def test_robot_not_found(self):
+        response = self.client.get('/api/v1/robots/gamma/base/status')
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('Robot not found', response.json['error'])
+
+    def test_robot_error_tagged(self):
+        self.robots['alpha'].arm.gripper.open.return_value = False
+        self.robots['alpha'].get_error.side_effect = ['', 'Gripper jammed']
+        response = self.client.post('/api/v1/robots/alpha/arm/gripper', json={'method': 'open'})
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(response.json['error']['robot_id'], 'alpha')
+        self.assertEqual(len(self.error_log.query(robot_id='alpha')), 1)
+
+    def test_fleet_status(self):
+        self.robots['alpha'].base.status.return_value = {'battery': 90}
+        self.robots['beta'].base.status.return_value = None
+        self.robots['beta'].get_error.side_effect = ['', 'Base not initialized']
+        response = self.client.get('/api/v1/robots/status')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['robots']['alpha'], {'response': {'battery': 90}})
+        self.assertEqual(response.json['robots']['beta']['error']['message'], 'Base not initialized')
+
+    def test_fleet_positions_parallel(self):
+        def slow_position():
+            time.sleep(0.2)
+            return {'x': 1, 'y': 2}
+        for robot in self.robots.values():
+            robot.base.maps.position.side_effect = slow_position
+
+        start = time.perf_counter()
+        response = self.client.get('/api/v1/robots/positions')
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['robots']['beta'], {'response': {'x': 1, 'y': 2}})
+        self.assertLess(elapsed, 0.35)
+
+    def test_fleet_positions_while_moving(self):
+        release = threading.Event()
+        self.robots['alpha'].base.maps.position.return_value = {'x': 1, 'y': 2}
+        self.robots['beta'].base.maps.position.return_value = {'x': 3, 'y': 4}
+        self.robots['beta'].base.maps.goto.side_effect = lambda *args: release.wait(2) or True
+        self.app.config['FLEET_TIMEOUT'] = 0.5
+        moving = self.fleet.get('beta').submit('maps', 'goto', self.robots['beta'].base.maps.goto, 1, 2, 0, 1)
+
+        response = self.client.get('/api/v1/robots/positions')
+        release.set()
+        moving.result(2)
+
+        self.assertEqual(response.json['robots']['alpha'], {'response': {'x': 1, 'y': 2}})
+        self.assertEqual(response.json['robots']['beta'], {'response': {'x': 3, 'y': 4}})
+
+    def test_fleet_status_hung_robot(self):
+        release = threading.Event()
+        self.robots['alpha'].base.status.return_value = {'battery': 90}
+        self.robots['beta'].base.status.side_effect = lambda: release.wait(2) or {'battery': 80}
+        self.app.config['FLEET_TIMEOUT'] = 0.1
+
+        start = time.perf_counter()
+        response = self.client.get('/api/v1/robots/status')
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        self.assertLess(elapsed, 1)
+        self.assertEqual(response.json['robots']['alpha'], {'response': {'battery': 90}})
+        self.assertEqual(response.json['robots']['beta']['error']['code'], 'command_timeout')
+
+    def test_robot_maps(self):
+        self.robots['alpha'].base.maps.list.return_value = [1]
+        self.robots['beta'].base.maps.list.return_value = [1, 2]
+        self.robots['alpha'].base.maps.fetch.return_value = 'alpha map'
+        self.robots['beta'].base.maps.fetch.return_value = 'beta map'
+
+        response = self.client.get('/api/v1/robots/beta/base/maps')
+        self.assertEqual(response.json, {'map_list': [1, 2]})
+        response = self.client.get('/api/v1/robots/alpha/base/maps/1')
+        self.assertEqual(response.json, {'map_id': 1, 'map_data': 'alpha map'})
+        response = self.client.get('/api/v1/robots/beta/base/maps/1')
+        self.assertEqual(response.json, {'map_id': 1, 'map_data': 'beta map'})
+        response = self.client.get('/api/v1/robots/gamma/base/maps/1')
+        self.assertEqual(response.status_code, 404)
+
+    def test_robot_markers(self):
+        markers = [{'id': 1, 'position': [0, 0]}]
+        self.client.post('/api/v1/robots/alpha/save-markers', json={'map_id': 1, 'markers': markers})
+        response = self.client.get('/api/v1/robots/alpha/load-markers/1')
+        self.assertEqual(response.json, {'map_id': 1, 'markers': markers})
+        response = self.client.get('/api/v1/robots/beta/load-markers/1')
+        self.assertEqual(response.json, {'map_id': 1, 'markers': []})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.01
+# Updated:    2026.10.18
 #
 # This script tests the mapping API endpoints.
 #
@@ -20,12 +20,16 @@ from unittest.mock import MagicMock
 from flask import Flask, jsonify
 import sys
 import os
+import time
 import pytest
 from app import create_app
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.routes.mapping import bp, map_data_db
+from app.maps import MapStore, diff_tiles
+from app.dispatch import Dispatcher
+from app.errors import ErrorLog
 
 class TestMappingDataAPI(unittest.TestCase):
 
@@ -40,6 +44,7 @@ class TestMappingDataAPI(unittest.TestCase):
         self.mock_robot = MagicMock()
         self.app = self.__class__.app
         self.app.config['ROBOT'] = self.mock_robot
+        self.app.config['DISPATCHER'] = Dispatcher(self.mock_robot, ErrorLog(), timeout=5)
 
         # self.mock_robot.base.maps.fetch.side_effect = lambda map_id: {'data': f'map{map_id}'}
 
@@ -54,7 +59,21 @@ class TestMappingDataAPI(unittest.TestCase):
         self.app.config['MAP_LIST'] = None
         response = self.client.get('/api/v1/base/maps')
         self.assertEqual(response.status_code, 404)
-        self.assertEqual(response.json, {"error": "No map list found"})
+        self.assertEqual(response.json['error']['code'], 'not_found')
+        self.assertEqual(response.json['error']['message'], 'No map list found')
+
+    def test_get_map_list_empty(self):
+        self.mock_robot.base.maps.list.return_value = []
+        response = self.client.get('/api/v1/base/maps')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {"map_list": []})
+
+    def test_get_map_list_timeout(self):
+        self.mock_robot.base.maps.list.side_effect = lambda: time.sleep(0.2) or [1]
+        self.app.config['DISPATCHER'].timeout = 0.05
+        response = self.client.get('/api/v1/base/maps')
+        self.assertEqual(response.status_code, 504)
+        self.assertEqual(response.json['error']['code'], 'command_timeout')
 
     def test_get_compressed_map_valid(self):
         self.mock_robot.base.maps.fetch.return_value = 'map1'
@@ -69,15 +88,141 @@ class TestMappingDataAPI(unittest.TestCase):
         self.mock_robot.base.maps.fetch.return_value = None
         response = self.client.get('/api/v1/base/maps/999')
         self.assertEqual(response.status_code, 404)
-        self.assertIn("Map data not found", response.json["error"])
+        self.assertIn("Map data not found", response.json["error"]["message"])
 
     def test_get_compressed_map_robot_missing(self):
-        del self.app.config['ROBOT']
+        del self.app.config['DISPATCHER']
         self.app.config['MAP_DATA'] = {}
         response = self.client.get('/api/v1/base/maps/1')
         self.assertEqual(response.status_code, 500)
         self.assertIn("Robot not configured", response.json["error"])
 
+    def test_get_compressed_map_streamed(self):
+        map_data = 'ab"c\\d' * 1000
+        self.mock_robot.base.maps.fetch.return_value = map_data
+        self.app.config['MAP_CHUNK_SIZE'] = 7
+        response = self.client.get('/api/v1/base/maps/2')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.json, {
+            "map_id": 2,
+            "map_data": map_data
+        })
+
+    def test_get_compressed_map_binary(self):
+        self.mock_robot.base.maps.fetch.return_value = 'x' * 100
+        self.app.config['MAP_CHUNK_SIZE'] = 16
+        response = self.client.get('/api/v1/base/maps/3', headers={'Accept': 'application/octet-stream'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/octet-stream')
+        self.assertEqual(response.data, b'x' * 100)
+
+    def test_get_map_diff(self):
+        self.app.config['MAP_TILE_SIZE'] = 4
+        self.mock_robot.base.maps.fetch.return_value = 'aaaabbbbccccdddd'
+        response = self.client.get('/api/v1/base/maps/10')
+        base_version = int(response.headers['X-Map-Version'])
+
+        map_data_db.invalidate(None)
+        self.mock_robot.base.maps.fetch.return_value = 'aaaabbXbccccddddee'
+        response = self.client.get(f'/api/v1/base/maps/10/diff?from={base_version}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['from'], base_version)
+        self.assertGreater(response.json['version'], base_version)
+        self.assertEqual(response.json['length'], 18)
+        self.assertEqual(response.json['tiles'], [[1, 'bbXb'], [4, 'ee']])
+
+    def test_get_map_diff_evicted_version(self):
+        self.mock_robot.base.maps.fetch.return_value = 'map11'
+        response = self.client.get('/api/v1/base/maps/11/diff?from=0')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {
+            "map_id": 11,
+            "map_data": 'map11'
+        })
+
+    def test_map_store_versions(self):
+        store = MapStore()
+        first = store.put(('alpha', 1), 'a', max_versions=2)
+        self.assertEqual(store.put(('alpha', 1), 'a', max_versions=2), first)
+        store.put(('alpha', 1), 'b', max_versions=2)
+        latest = store.put(('alpha', 1), 'c', max_versions=2)
+        store.put(('beta', 1), 'd')
+        self.assertIsNone(store.get(('alpha', 1), first))
+        self.assertEqual(store.latest(('alpha', 1)), (latest, 'c'))
+        self.assertIn(('alpha', 1), store)
+        store.invalidate('alpha')
+        self.assertNotIn(('alpha', 1), store)
+        self.assertIn(('beta', 1), store)
+
+    def test_map_store_eviction(self):
+        store = MapStore()
+        store.put(('alpha', 1), 'a' * 4, max_size=10)
+        store.put(('alpha', 2), 'b' * 4, max_size=10)
+        store.latest(('alpha', 1))
+        store.put(('alpha', 3), 'c' * 4, max_size=10)
+        self.assertIn(('alpha', 1), store)
+        self.assertNotIn(('alpha', 2), store)
+        self.assertEqual(store.size, 8)
+
+        # A single map larger than the cache is still kept, without older versions
+        store.put(('alpha', 3), 'd' * 12, max_size=10)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.latest(('alpha', 3))[1], 'd' * 12)
+        self.assertEqual(store.size, 12)
+
+    def test_map_store_trim(self):
+        store = MapStore()
+        first = store.put(('alpha', 1), 'a')
+        store.put(('alpha', 1), 'b')
+        store.put(('beta', 1), 'c')
+        store.trim(1)
+        self.assertIsNone(store.get(('alpha', 1), first))
+        self.assertEqual(store.size, 2)
+        store.trim(1, max_size=1)
+        self.assertNotIn(('alpha', 1), store)
+        self.assertIn(('beta', 1), store)
+
+    def test_diff_tiles_insert(self):
+        # An insertion shifts every later tile
+        self.assertEqual(list(diff_tiles('aaaabbbbccccdddd', 'aXaaabbbbccccdddd', 4)), [0, 1, 2, 3, 4])
+
+    def test_get_map_diff_insert(self):
+        self.app.config['MAP_TILE_SIZE'] = 4
+        self.mock_robot.base.maps.fetch.return_value = 'aaaabbbbccccdddd'
+        response = self.client.get('/api/v1/base/maps/13')
+        base_version = int(response.headers['X-Map-Version'])
+
+        map_data_db.invalidate(None)
+        self.mock_robot.base.maps.fetch.return_value = 'aXaaabbbbccccdddd'
+        response = self.client.get(f'/api/v1/base/maps/13/diff?from={base_version}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {
+            "map_id": 13,
+            "map_data": 'aXaaabbbbccccdddd'
+        })
+
+    def test_diff_tiles(self):
+        self.assertEqual(list(diff_tiles('abcdefgh', 'abcdefgh', 4)), [])
+        self.assertEqual(list(diff_tiles('abcdefgh', 'abcd', 4)), [])
+        self.assertEqual(list(diff_tiles('abcdefgh', 'abcdefg\u00e9', 4)), [1])
+        self.assertEqual(list(diff_tiles('abcdef', 'abcdefgh', 4)), [1])
+        self.assertEqual(list(diff_tiles('abcdef', 'abcdef', 4)), [])
+        self.assertEqual(list(diff_tiles('x' * 100, 'x' * 100, 1024)), [])
+        self.assertEqual(list(diff_tiles('abcdef', 'abcdeX', 4)), [1])
+        self.assertEqual(list(diff_tiles('abcdefgh', 'abcdef', 4)), [])
+
+    def test_get_map_diff_unchanged_short_map(self):
+        self.app.config['MAP_TILE_SIZE'] = 1024
+        self.mock_robot.base.maps.fetch.return_value = 'x' * 100
+        response = self.client.get('/api/v1/base/maps/12')
+        version = int(response.headers['X-Map-Version'])
+
+        response = self.client.get(f'/api/v1/base/maps/12/diff?from={version}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['tiles'], [])
+        self.assertEqual(response.json['length'], 100)
+
     def test_save_markers_success(self):
         test_data = {
             "map_id": 1,
@@ -6,7 +6,7 @@
 #
 # Created By: Allen Chien
 # Created:    April 2025
-# Updated:    2025.04.01
+# Updated:    2026.10.18
 #
 # This script tests the status API endpoints.
 #
@@ -24,6 +24,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.routes.status import bp  # Import your Blueprint containing the routes
+from app.errors import CommandError, ErrorLog, COMMAND_FAILED
 
 class TestStatusAPI(unittest.TestCase):
 
@@ -39,6 +40,7 @@ class TestStatusAPI(unittest.TestCase):
         # Mock the robot object inside the app config for each test
         self.mock_robot = MagicMock()
         self.app.config['ROBOT'] = self.mock_robot
+        self.app.config['ERROR_LOG'] = ErrorLog(maxlen=3)
 
     def test_get_status_success(self):
         # Mock the return value of robot.get_current_action()
@@ -75,7 +77,7 @@ class TestStatusAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
 
         # Check that the response JSON contains the expected error message
-        self.assertEqual(response.json, {"error": "No error"})
+        self.assertEqual(response.json, {"error": "No error", "errors": []})
 
     def test_get_error_failure(self):
         # Mock the return value of robot.get_error() as None or an error
@@ -87,7 +89,39 @@ class TestStatusAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
 
         # Check that the response JSON contains a None or empty error message
-        self.assertEqual(response.json, {"error": None})
+        self.assertEqual(response.json, {"error": None, "errors": []})
+
+    def test_get_error_log(self):
+        error_log = self.app.config['ERROR_LOG']
+        error_log.record(CommandError(COMMAND_FAILED, 'arm', 'move-joint', 'Joint out of range', 12.5))
+        error_log.record(CommandError(COMMAND_FAILED, 'head', 'look', 'Head not responding', 3.0))
+
+        response = self.client.get('/api/error')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['error'], 'Head not responding')
+        self.assertEqual([e['subsystem'] for e in response.json['errors']], ['arm', 'head'])
+        self.mock_robot.get_error.assert_not_called()
+
+    def test_get_error_log_filtered(self):
+        error_log = self.app.config['ERROR_LOG']
+        first = error_log.record(CommandError(COMMAND_FAILED, 'arm', 'move-joint', 'Joint out of range', 12.5))
+        error_log.record(CommandError(COMMAND_FAILED, 'head', 'look', 'Head not responding', 3.0))
+        error_log.record(CommandError(COMMAND_FAILED, 'arm', 'move-joints', 'Arm busy', 4.0))
+
+        response = self.client.get(f'/api/error?since={first.id}&subsystem=arm')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([e['message'] for e in response.json['errors']], ['Arm busy'])
+
+    def test_get_error_log_bounded(self):
+        error_log = self.app.config['ERROR_LOG']
+        for i in range(5):
+            error_log.record(CommandError(COMMAND_FAILED, 'base', 'start', f'error {i}', 1.0))
+
+        response = self.client.get('/api/error')
+
+        self.assertEqual([e['message'] for e in response.json['errors']], ['error 2', 'error 3', 'error 4'])
 
 if __name__ == '__main__':
     unittest.main()